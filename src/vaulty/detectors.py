@@ -3,21 +3,120 @@
 from __future__ import annotations
 
 import re
-from dataclasses import asdict, dataclass
+import threading
+from dataclasses import dataclass
+from functools import cache
+from itertools import islice
 
 from .validators import luhn_valid
 
+try:  # Optional Hyperscan (SIMD multi-pattern DFA) prefilter; plain `re` is the fallback.
+    import hyperscan
+except ImportError:  # pragma: no cover - depends on the optional native package
+    hyperscan = None  # type: ignore[assignment]
+
 PATTERNS: dict[str, re.Pattern[str]] = {
     "email": re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
     "ssn_us": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
     "phone": re.compile(r"\b(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b"),
-    "credit_card": re.compile(r"\b(?:\d[ -]?){13,19}\b"),
+    "credit_card": re.compile(r"\b\d(?:[ -]?\d){12,18}\b"),
     "aws_key": re.compile(r"\bAKIA[0-9A-Z]{16}\b"),
     "api_key": re.compile(
         r"(?i)(?:api_key|apikey|secret|token)\s*[:=]\s*['\"]([a-zA-Z0-9_\-]{20,})['\"]"
     ),
 }
 
+
+def _hyperscan_expression(pattern: str) -> bytes:
+    """Return pattern for Hyperscan with \\s widened to Python's whitespace set.
+
+    Python's \\s also matches U+001C-U+001F, which Hyperscan's UCP \\s does not; without
+    this the prefilter would drop detectors that `re` can match. Handles the flat
+    (non-nested) character classes used in PATTERNS.
+    """
+    parts: list[str] = []
+    in_class = False
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            escape = pattern[index : index + 2]
+            if escape == r"\s":
+                escape = r"\s\x1c-\x1f" if in_class else r"[\s\x1c-\x1f]"
+            parts.append(escape)
+            index += 2
+            continue
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        parts.append(char)
+        index += 1
+    return "".join(parts).encode("utf-8")
+
+
+_HYPERSCAN_DB_LOCK = threading.Lock()
+
+
+def _hyperscan_db() -> hyperscan.Database | None:
+    """Return the shared Hyperscan database, compiling it on first use, or None."""
+    # Compiling takes ~0.7 s, so it is deferred until a scan instead of paid at import
+    # (reporting and the app import this module just for Finding). The lock keeps
+    # concurrent first scans from each compiling their own copy.
+    with _HYPERSCAN_DB_LOCK:
+        return _compile_hyperscan_db()
+
+
+@cache
+def _compile_hyperscan_db() -> hyperscan.Database | None:
+    """Compile every detector into one Hyperscan database, or return None."""
+    if hyperscan is None:
+        return None
+    # PREFILTER may over-report but never misses a match, so `re` stays authoritative.
+    flags = (
+        hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    try:
+        database.compile(
+            expressions=[_hyperscan_expression(pattern.pattern) for pattern in PATTERNS.values()],
+            ids=list(range(len(PATTERNS))),
+            flags=[flags] * len(PATTERNS),
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+DETECTOR_NAMES: tuple[str, ...] = tuple(PATTERNS)
+
+# Hyperscan scratch space may only be used by one scan at a time; Streamlit runs
+# each session in its own thread, so every thread allocates its own.
+_HYPERSCAN_LOCAL = threading.local()
+
+# Lowercase literals at least one of which every match of a detector must contain.
+# If none occur in the text, that detector's regex pass is skipped entirely.
+PATTERN_ANCHORS: dict[str, tuple[str, ...]] = {
+    "email": ("@",),
+    "aws_key": ("akia",),
+    "api_key": ("api_key", "apikey", "secret", "token"),
+}
+
+# Non-ASCII letters that (?i) matches against ASCII "i" but casefold() and Hyperscan's
+# caseless mode keep distinct; "ſ" and the Kelvin sign already fold to "s" and "k".
+_IGNORECASE_EXTRA_FOLDS = str.maketrans({"\u0130": "i", "\u0131": "i"})
+
+# Fewest digits any match of a detector contains; documents with fewer digits skip it.
+MIN_DIGITS_BY_TYPE: dict[str, int] = {
+    "ssn_us": 9,
+    "phone": 10,
+    "credit_card": 13,
+}
+DIGIT_RE = re.compile(r"\d")
+
 RISK_BASE_BY_TYPE: dict[str, float] = {
     "credit_card": 4.0,
     "ssn_us": 4.0,
@@ -38,6 +137,11 @@ RISK_CONTEXT_BOOST_TERMS: dict[str, float] = {
     "cvv": 0.5,
 }
 
+# Highest boost first (ties keep declaration order) so scoring can stop at the first hit.
+CONTEXT_TERMS_BY_BOOST: tuple[tuple[str, float], ...] = tuple(
+    sorted(RISK_CONTEXT_BOOST_TERMS.items(), key=lambda item: -item[1])
+)
+
 
 @dataclass(slots=True)
 class Finding:
@@ -52,30 +156,44 @@ class Finding:
 
     def to_dict(self) -> dict[str, object]:
         """Return a stable, serializable representation of this finding."""
-        return asdict(self)
+        # Field-by-field literal; asdict() walks fields() and deep-copies every value
+        return {
+            "detector": self.detector,
+            "match": self.match,
+            "start": self.start,
+            "end": self.end,
+            "risk_score": self.risk_score,
+            "why": self.why,
+        }
 
 
-def _validate_detector_hit(detector: str, value: str) -> bool:
-    """Return True if the candidate should be kept after validation."""
+def _validate_detector_hit(detector: str, value: str, seen: dict[str, bool]) -> bool:
+    """Return True if the candidate should be kept after validation.
+
+    ``seen`` memoizes Luhn results for one scan only, so repeated card numbers are
+    checked once without raw candidates outliving the scan.
+    """
     if detector == "credit_card":
-        return luhn_valid(value)
+        valid = seen.get(value)
+        if valid is None:
+            valid = seen[value] = luhn_valid(value)
+        return valid
     return True
 
 
-def _score_with_context(detector: str, context_window: str) -> tuple[float, str]:
-    """Return (score, why) based on base risk and context terms."""
+def _score_with_context(detector: str, lower_ctx: str) -> tuple[float, str]:
+    """Return (score, why) based on base risk and an already-lowercased context window."""
     base = RISK_BASE_BY_TYPE.get(detector, 2.0)
-    lower_ctx = context_window.lower()
 
     applied_boost = 0.0
     found_keyword = None
 
-    # Check for context keywords
-    for word, inc in RISK_CONTEXT_BOOST_TERMS.items():
-        # ✅ FIXED: Combined nested if statements (SIM102)
-        if word in lower_ctx and inc > applied_boost:
+    # Check for context keywords; strongest first, so the first hit wins
+    for word, inc in CONTEXT_TERMS_BY_BOOST:
+        if word in lower_ctx:
             applied_boost = inc
             found_keyword = word
+            break
 
     score = min(10.0, base + applied_boost)
 
@@ -92,22 +210,99 @@ def _score_with_context(detector: str, context_window: str) -> tuple[float, str]
     return score, why
 
 
+def _hyperscan_candidates(text: str) -> set[str] | None:
+    """Return detectors that may match in one Hyperscan pass, or None to try them all."""
+    database = _hyperscan_db()
+    if database is None:
+        return None
+    if not text.isascii():
+        # Only detector ids are collected, so shifting byte offsets here is harmless
+        text = text.translate(_IGNORECASE_EXTRA_FOLDS)
+    try:
+        data = text.encode("utf-8")
+    except UnicodeEncodeError:
+        return None
+
+    candidates: set[str] = set()
+
+    def on_match(pattern_id: int, _start: int, _end: int, _flags: int, _ctx: object) -> None:
+        candidates.add(DETECTOR_NAMES[pattern_id])
+
+    scratch = getattr(_HYPERSCAN_LOCAL, "scratch", None)
+    try:
+        if scratch is None:
+            scratch = _HYPERSCAN_LOCAL.scratch = hyperscan.Scratch(database)
+        database.scan(data, match_event_handler=on_match, scratch=scratch)
+    except hyperscan.error:
+        # Fall back to running every detector rather than failing the scan
+        return None
+    return candidates
+
+
+def _count_digits(text: str, limit: int) -> int:
+    """Return how many digits text contains, counting no further than limit."""
+    return sum(1 for _ in islice(DIGIT_RE.finditer(text), limit))
+
+
+def _anchor_text(text: str, lower_text: str) -> str:
+    """Return text folded the way (?i) patterns compare it, for anchor lookups."""
+    if text.isascii():
+        return lower_text
+    return text.translate(_IGNORECASE_EXTRA_FOLDS).casefold()
+
+
+def _active_detectors(text: str, lower_text: str) -> list[tuple[str, re.Pattern[str]]]:
+    """Return the detectors that can possibly match, using cheap document-level gates."""
+    candidates = _hyperscan_candidates(text)
+    anchor_text = _anchor_text(text, lower_text)
+    digit_count: int | None = None
+    active: list[tuple[str, re.Pattern[str]]] = []
+
+    for detector_name, pattern in PATTERNS.items():
+        if candidates is not None and detector_name not in candidates:
+            continue
+        anchors = PATTERN_ANCHORS.get(detector_name)
+        if anchors and not any(anchor in anchor_text for anchor in anchors):
+            continue
+        min_digits = MIN_DIGITS_BY_TYPE.get(detector_name)
+        if min_digits:
+            if digit_count is None:
+                digit_count = _count_digits(text, max(MIN_DIGITS_BY_TYPE.values()))
+            if digit_count < min_digits:
+                continue
+        active.append((detector_name, pattern))
+
+    return active
+
+
 def detect(text: str, *, file_name: str | None = None) -> list[Finding]:
     """Run all detectors on input text and return a list of Finding objects."""
     findings: list[Finding] = []
+    lower_text = text.lower()
+    active = _active_detectors(text, lower_text)
+    if not active:
+        # Nothing can match (no "@", enough digits, or key keywords): skip every regex pass
+        return findings
 
-    for detector_name, pattern in PATTERNS.items():
+    # A few characters (e.g. "İ") lowercase to two, shifting offsets; then lower per window
+    lower_aligned = len(lower_text) == len(text)
+    validated: dict[str, bool] = {}
+
+    for detector_name, pattern in active:
         for match_obj in pattern.finditer(text):
             raw_value = match_obj.group(0)
             if detector_name == "api_key" and match_obj.groups():
                 raw_value = match_obj.group(1)
 
-            if not _validate_detector_hit(detector_name, raw_value):
+            if not _validate_detector_hit(detector_name, raw_value, validated):
                 continue
 
             left_idx = max(0, match_obj.start() - 40)
             right_idx = min(len(text), match_obj.end() + 40)
-            window = text[left_idx:right_idx]
+            if lower_aligned:
+                window = lower_text[left_idx:right_idx]
+            else:
+                window = text[left_idx:right_idx].lower()
 
             score, why = _score_with_context(detector_name, window)
 
@@ -3,10 +3,21 @@
 from __future__ import annotations
 
 import csv  # Keep lightweight imports here
+import threading
+from collections.abc import Iterable
+from io import BytesIO, StringIO
 from pathlib import Path
+from typing import BinaryIO
 
 # 🚫 DELETE all imports related to pdfminer, pypdf, or heavy libraries from here!
 
+# Line-by-line readers use a 1 MiB buffer instead of io.DEFAULT_BUFFER_SIZE (8 KiB)
+READ_BUFFER_BYTES = 1 << 20
+
+# PDFium is not thread-safe and Streamlit runs each session in its own thread;
+# concurrent use segfaults the whole process, so all PDFium calls are serialized.
+_PDFIUM_LOCK = threading.Lock()
+
 # ---------------------------------------------------------
 # TEXT Extractor (Lightweight)
 # ---------------------------------------------------------
@@ -23,15 +34,34 @@ def from_txt(path: Path) -> tuple[str, str]:
 # ---------------------------------------------------------
 
 
-def from_csv(path: Path) -> tuple[str, str]:
-    """Read content from a CSV file and return concatenated text."""
+def _join_csv_cells(lines: Iterable[str]) -> str:
+    """Return every CSV cell from lines joined by single spaces."""
     # Only uses the global 'csv' library (lightweight)
     all_text = []
-    with path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        for row in reader:
-            all_text.extend(row)
-    return "csv", " ".join(all_text)
+    for row in csv.reader(lines):
+        all_text.extend(row)
+    return " ".join(all_text)
+
+
+def from_csv(path: Path) -> tuple[str, str]:
+    """Read content from a CSV file and return concatenated text."""
+    with path.open("r", newline="", encoding="utf-8", buffering=READ_BUFFER_BYTES) as f:
+        return "csv", _join_csv_cells(f)
+
+
+# ---------------------------------------------------------
+# In-memory Extractors (uploads that never touch disk)
+# ---------------------------------------------------------
+
+
+def from_txt_bytes(data: bytes | memoryview) -> tuple[str, str]:
+    """Decode text content that is already in memory."""
+    return "text", str(data, "utf-8")
+
+
+def from_csv_bytes(data: bytes | memoryview) -> tuple[str, str]:
+    """Read CSV content that is already in memory and return concatenated text."""
+    return "csv", _join_csv_cells(StringIO(str(data, "utf-8"), newline=""))
 
 
 # ---------------------------------------------------------
@@ -39,17 +69,44 @@ def from_csv(path: Path) -> tuple[str, str]:
 # ---------------------------------------------------------
 
 
-def from_pdf(path: Path) -> tuple[str, str]:
-    """Read content from a PDF file."""
+def from_pdf(source: Path | BinaryIO) -> tuple[str, str]:
+    """Read content from a PDF file path or an open binary file object."""
     # ✅ CRITICAL FIX: The memory-intensive import must be inside the function.
-    from io import StringIO
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        # PDFium (C++) extracts text several times faster than pure-Python pdfminer.
+        pages: list[str] = []
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            try:
+                # Release each page's native buffers before loading the next one
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    pages.append(textpage.get_text_bounded())
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        return "pdf", "\n".join(pages)
 
     from pdfminer.high_level import extract_text_to_fp
 
     output_string = StringIO()
 
-    # Use pdfminer logic here
-    with path.open("rb") as input_file:
-        extract_text_to_fp(input_file, output_string)
+    # Use pdfminer logic here; open file objects (e.g. uploads) are read in place
+    if isinstance(source, Path):
+        with source.open("rb", buffering=READ_BUFFER_BYTES) as input_file:
+            extract_text_to_fp(input_file, output_string)
+    else:
+        extract_text_to_fp(source, output_string)
 
     return "pdf", output_string.getvalue()
+
+
+def from_pdf_bytes(data: bytes | memoryview) -> tuple[str, str]:
+    """Read PDF content that is already in memory."""
+    return from_pdf(BytesIO(data))
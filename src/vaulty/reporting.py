@@ -3,27 +3,39 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
 
 from .detectors import Finding
 
+try:  # Optional Rust/SIMD serializer; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None  # type: ignore[assignment]
+
+
+def to_json_bytes(findings: list[Finding]) -> bytes:
+    """Return the JSON report as UTF-8 bytes, preferring orjson."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively, skipping the per-finding to_dict() copy
+        return orjson.dumps(findings, option=orjson.OPT_INDENT_2)
+    return json.dumps([f.to_dict() for f in findings], indent=2).encode("utf-8")
+
 
 def to_json(findings: list[Finding], outfile: Path, return_as_string: bool = False) -> str | None:
-    payload = [f.to_dict() for f in findings]
-    json_str = json.dumps(payload, indent=2)
+    report_bytes = to_json_bytes(findings)
 
     if return_as_string:
-        return json_str
+        return report_bytes.decode("utf-8")
 
     outfile.parent.mkdir(parents=True, exist_ok=True)
-    outfile.write_text(json_str, encoding="utf-8")
+    outfile.write_bytes(report_bytes)
     return None
 
 
 def human_summary(findings: list[Finding]) -> str:
-    counts: dict[str, int] = {}
-    for finding in findings:
-        counts[finding.detector] = counts.get(finding.detector, 0) + 1
+    counts = Counter(map(attrgetter("detector"), findings))
 
     if not counts:
         return "Findings Summary:\n- No issues detected"
@@ -2,20 +2,21 @@
 
 from __future__ import annotations
 
-import mimetypes
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from .detectors import Finding, detect
 
-SUPPORTED_SUFFIXES = {".txt", ".csv", ".pdf"}
+SUPPORTED_SUFFIXES = frozenset({".txt", ".csv", ".pdf"})
 
-SUPPORTED_MIME_TYPES = {
-    "text/plain",
-    "text/csv",
-    "application/pdf",
-}
+SUPPORTED_MIME_TYPES = frozenset(
+    {
+        "text/plain",
+        "text/csv",
+        "application/pdf",
+    }
+)
 
 ExtractorFunc = Callable[[Path], tuple[str, str]]
 
@@ -34,6 +35,9 @@ def _pick_extractor(path: Path) -> ExtractorFunc | None:
     if suffix == ".pdf":
         return from_pdf
 
+    # Only files with an unknown suffix pay for the mimetypes registry lookup.
+    import mimetypes
+
     mime_type, _ = mimetypes.guess_type(str(path))
     if mime_type == "text/plain":
         return from_txt
@@ -74,3 +78,28 @@ def scan_file(
     findings = detect(file_text, file_name=path.name)
     # Return both findings and the text so UI can do redaction/highlighting
     return findings, file_text
+
+
+def scan_bytes(
+    data: bytes | memoryview,
+    suffix: str,
+    *,
+    options: dict[str, Any] | None = None,
+) -> tuple[list[Finding], str]:
+    """
+    Scan in-memory TXT/CSV/PDF content without a temp-file round trip.
+    Returns: (List of findings, The full extracted text string)
+    """
+    from .extractors import from_csv_bytes, from_pdf_bytes, from_txt_bytes
+
+    suffix = suffix.lower()
+    if suffix == ".txt":
+        _kind, text = from_txt_bytes(data)
+    elif suffix == ".csv":
+        _kind, text = from_csv_bytes(data)
+    elif suffix == ".pdf":
+        _kind, text = from_pdf_bytes(data)
+    else:
+        return [], ""
+
+    return detect(text), text
@@ -2,26 +2,48 @@
 
 from __future__ import annotations
 
+import unicodedata
+
+# bytes.translate() tables: delete every non-digit byte / double-and-fold an ASCII digit
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+_LUHN_DOUBLE = bytes.maketrans(b"0123456789", b"0246813579")
+
+
+def _fold_decimal_digits(text: str) -> str:
+    """Return text with every Unicode decimal digit (what `\\d` matches) folded to ASCII."""
+    return "".join(
+        chr(0x30 + value) if (value := unicodedata.decimal(char, -1)) >= 0 else char
+        for char in text
+    )
+
+
+def _ascii_digits(text: str) -> bytes:
+    """Return the digits of text as ASCII bytes, stripped in C by bytes.translate()."""
+    if not text.isascii():
+        # The detector regexes use Unicode \d, so full-width or Arabic-Indic card numbers
+        # must still reach the checksum; superscripts and other non-decimal digits do not
+        text = _fold_decimal_digits(text)
+    return text.encode("ascii", "ignore").translate(None, _NON_DIGIT_BYTES)
+
 
 def digits_only(text: str) -> str:
-    """Return only the digits in text."""
-    return "".join(ch for ch in text if ch.isdigit())
+    """Return only the decimal digits in text, as ASCII."""
+    return _ascii_digits(text).decode("ascii")
 
 
 def luhn_valid(candidate: str) -> bool:
     """Return True if candidate passes the Luhn checksum (credit cards)."""
-    s = digits_only(candidate)
-    if not (13 <= len(s) <= 19):
+    if len(candidate) < 13:
+        # Too short to hold 13 digits; skip the encode/translate copies entirely
         return False
 
-    total = 0
-    reversed_digits = list(map(int, reversed(s)))
-    for index, digit in enumerate(reversed_digits):
-        new_val = digit
-        if index % 2 == 1:
-            new_val *= 2
-            if new_val > 9:
-                new_val -= 9
-        total += new_val
+    # Strip to ASCII digits and sum them with C-level translate()/sum(), no Python loop
+    digits = _ascii_digits(candidate)
+    n = len(digits)
+    if not (13 <= n <= 19):
+        return False
 
+    # Every second digit from the right is doubled; the table folds values > 9 as well.
+    # Summing raw bytes adds 48 ("0") per digit, which is subtracted once at the end.
+    total = sum(digits[-1::-2]) + sum(digits[-2::-2].translate(_LUHN_DOUBLE)) - 48 * n
     return total % 10 == 0
@@ -1,16 +1,12 @@
 import sys
 from pathlib import Path
 
-current_dir = Path(__file__).parent.resolve()
-src_dir = current_dir / "src"
-sys.path.insert(0, str(src_dir))
+src_dir = str(Path(__file__).parent.resolve() / "src")
+# Streamlit re-executes this script on every rerun; prepend src/ only once per process
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
-
-try:
-    from vaulty.app_streamlit import main
-except ImportError as e:
-    print(f"Error importing vaulty: {e}")
-    raise e
+from vaulty.app_streamlit import main  # noqa: E402 - needs src/ on sys.path first
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,55 @@
+import logging
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("streamlit")
+
+from vaulty.app_streamlit import cached_scan, log_failed_write, redact_text  # noqa: E402
+from vaulty.detectors import Finding, detect  # noqa: E402
+
+
+def test_redact_text_replaces_each_finding() -> None:
+    text = "Mail a@b.com or SSN 123-45-6789."
+    assert redact_text(text, detect(text)) == "Mail [REDACTED: EMAIL] or SSN [REDACTED: SSN_US]."
+
+
+def test_redact_text_merges_overlapping_findings() -> None:
+    text = "+1 555 123 4567 8901 234"
+    findings = detect(text)
+    assert {f.detector for f in findings} == {"phone", "credit_card"}
+
+    redacted = redact_text(text, findings)
+
+    assert redacted == "+[REDACTED: PHONE]"
+    assert "8901" not in redacted
+
+
+def test_redact_text_skips_out_of_range_findings() -> None:
+    findings = [
+        Finding("email", "", -2, 1, 2.0, ""),
+        Finding("email", "", 4, 9, 2.0, ""),
+    ]
+    assert redact_text("abcdef", findings) == "abcdef"
+
+
+def test_log_failed_write_reports_exception(caplog: pytest.LogCaptureFixture) -> None:
+    future: Future = Future()
+    future.set_exception(OSError("disk full"))
+    log_failed_write(logging.getLogger("vaulty.test"), Path("r.json"), future)
+
+    assert "Failed to write report r.json" in caplog.text
+    assert "disk full" in caplog.text
+
+
+def test_cached_scan_keeps_only_the_latest_result_per_session() -> None:
+    session_cache: dict = {}
+    options = (("anonymize", True),)
+    first = cached_scan(session_cache, "d1", ".txt", options, memoryview(b"mail a@b.com"))
+    assert cached_scan(session_cache, "d1", ".txt", options, memoryview(b"")) is first
+
+    second = cached_scan(session_cache, "d2", ".txt", options, memoryview(b"SSN 123-45-6789"))
+
+    assert [f.detector for f in second[0]] == ["ssn_us"]
+    assert list(session_cache.values()) == [second]
@@ -1,3 +1,6 @@
+import pytest
+
+from vaulty import detectors
 from vaulty.detectors import detect
 
 
@@ -19,8 +22,110 @@ def test_credit_card_valid_passes() -> None:
     assert any(f.detector == "credit_card" for f in out)
 
 
+@pytest.mark.parametrize(
+    "card",
+    ["４１１１ １１１１ １１１１ １１１１", "٤١١١ ١١١١ ١١١١ ١١١١"],
+)
+def test_credit_card_in_unicode_digits_is_detected(card: str) -> None:
+    out = detect(f"card {card}")
+    assert [f.match for f in out if f.detector == "credit_card"] == [card]
+
+
+def test_api_key_anchor_is_case_insensitive() -> None:
+    text = "API_KEY = 'abcdefghijklmnopqrstuvwxyz'"
+    out = detect(text)
+    assert [f.match for f in out if f.detector == "api_key"] == ["abcdefghijklmnopqrstuvwxyz"]
+
+
+@pytest.mark.parametrize("keyword", ["\u017fecret", "TO\u212aEN", "ap\u0131_key", "AP\u0130KEY"])
+def test_api_key_anchor_follows_regex_case_folding(keyword: str) -> None:
+    text = f"{keyword} = 'abcdefghijklmnopqrstuvwxyz'"
+    out = detect(text)
+    assert [f.match for f in out if f.detector == "api_key"] == ["abcdefghijklmnopqrstuvwxyz"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Visa 4111 1111 1111 1111, mail a@b.com, SSN 123-45-6789, call 555-123-4567",
+        # Python's \s also matches U+001C-U+001F; Hyperscan's UCP \s does not
+        "call 555\x1c123\x1c4567",
+        "token\x1f=\x1f'abcdefghijklmnopqrstuvwxyz'",
+        # (?i) folds dotless and dotted I to "i"; Hyperscan's caseless mode does not
+        "ap\u0131_key = 'abcdefghijklmnopqrstuvwxyz'",
+    ],
+)
+def test_hyperscan_prefilter_matches_plain_re(monkeypatch: pytest.MonkeyPatch, text: str) -> None:
+    pytest.importorskip("hyperscan")
+    assert detectors._hyperscan_db() is not None
+    with_prefilter = detect(text)
+    assert with_prefilter
+    monkeypatch.setattr(detectors, "_hyperscan_db", lambda: None)
+    assert detect(text) == with_prefilter
+
+
+def test_hyperscan_prefilter_is_safe_across_threads() -> None:
+    """Each thread needs its own Hyperscan scratch; a shared one raises ScratchInUseError."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    pytest.importorskip("hyperscan")
+    text = "mail a@b.com call 555-123-4567 " * 10000
+    expected = detectors._hyperscan_candidates(text)
+    assert expected is not None
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: detectors._hyperscan_candidates(text), range(32)))
+
+    assert results == [expected] * 32
+
+
+def test_context_boost_prefers_strongest_keyword() -> None:
+    out = detect("visa secret 4111 1111 1111 1111")
+    card = next(f for f in out if f.detector == "credit_card")
+    assert card.risk_score == 5.0
+    assert "'secret'" in card.why
+
+
 def test_empty_text_is_safe() -> None:
     assert detect("") == []
 
 
 # Developer Notes and revisions
+
+
+def test_finding_to_dict_matches_asdict() -> None:
+    from dataclasses import asdict
+
+    finding = detect("Contact me at user@example.com")[0]
+    assert finding.to_dict() == asdict(finding)
+    assert list(finding.to_dict()) == list(asdict(finding))
+
+
+def test_clean_document_skips_every_detector(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(detectors, "_hyperscan_db", lambda: None)
+    text = "Quarterly notes: nothing sensitive in here at all."
+    assert detectors._active_detectors(text, text.lower()) == []
+    assert detect(text) == []
+
+
+def test_credit_card_match_excludes_trailing_separator() -> None:
+    text = "Card 4111 1111 1111 1111 exp 12/30"
+    card = next(f for f in detect(text) if f.detector == "credit_card")
+    assert card.match == "4111 1111 1111 1111"
+    assert text[card.start : card.end] == card.match
+
+
+def test_digit_gate_keeps_only_detectors_with_enough_digits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(detectors, "_hyperscan_db", lambda: None)
+    text = "Invoice 7, call 555-123-4567 today"
+    active = [name for name, _ in detectors._active_detectors(text, text.lower())]
+    assert active == ["ssn_us", "phone"]
+    assert [f.detector for f in detect(text)] == ["phone"]
+
+
+def test_repeated_card_numbers_are_all_reported() -> None:
+    text = "row 4111 1111 1111 1111\nrow 4111 1111 1111 1111\nrow 4111 1111 1111 1112"
+    cards = [f for f in detect(text) if f.detector == "credit_card"]
+    assert [f.start for f in cards] == [4, 28]
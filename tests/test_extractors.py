@@ -1,6 +1,7 @@
+from io import BytesIO
 from pathlib import Path
 
-from vaulty.extractors import from_csv, from_txt
+from vaulty.extractors import from_csv, from_csv_bytes, from_pdf, from_txt
 
 
 def test_from_txt(tmp_path: Path) -> None:
@@ -20,3 +21,34 @@ def test_from_csv(tmp_path: Path) -> None:
     assert kind == "csv"
     assert "x@y.com" in text
     assert "John" in text
+
+
+def test_from_csv_bytes_matches_file(tmp_path: Path) -> None:
+    data = b'email,name\nx@y.com,"Doe, John"\n'
+    test_file = tmp_path / "a.csv"
+    test_file.write_bytes(data)
+
+    assert from_csv_bytes(data) == from_csv(test_file)
+
+
+def test_from_pdf_stream_matches_file(tmp_path: Path, minimal_pdf: bytes) -> None:
+    test_file = tmp_path / "a.pdf"
+    test_file.write_bytes(minimal_pdf)
+
+    kind, text = from_pdf(BytesIO(minimal_pdf))
+    assert kind == "pdf"
+    assert "a@b.com" in text
+    assert (kind, text) == from_pdf(test_file)
+
+
+def test_from_pdf_is_safe_across_threads(minimal_pdf: bytes) -> None:
+    """PDFium is not thread-safe; concurrent sessions must not crash the process."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def extract(_: int) -> tuple[str, str]:
+        return from_pdf(BytesIO(minimal_pdf))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(extract, range(3200)))
+
+    assert results == [("pdf", "Email a@b.com")] * 3200
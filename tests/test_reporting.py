@@ -1,7 +1,11 @@
+import json
 from pathlib import Path
 
+import pytest
+
+from vaulty import reporting
 from vaulty.detectors import Finding
-from vaulty.reporting import human_summary, to_json
+from vaulty.reporting import human_summary, to_json, to_json_bytes
 
 
 def _sample_finding() -> Finding:
@@ -29,6 +33,26 @@ def test_to_json_schema(tmp_path: Path) -> None:
     # This stabilizes our external contract for grading/review
 
 
+def test_to_json_bytes_matches_written_report(tmp_path: Path) -> None:
+    """The in-memory bytes must be exactly what to_json writes to disk."""
+    out_path = tmp_path / "report.json"
+    finding = _sample_finding()
+
+    to_json([finding], out_path)
+
+    assert to_json_bytes([finding]) == out_path.read_bytes()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_bytes_payload(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Native dataclass serialization and the stdlib fallback emit the same records."""
+    if not use_orjson:
+        monkeypatch.setattr(reporting, "orjson", None)
+    finding = _sample_finding()
+
+    assert json.loads(to_json_bytes([finding])) == [finding.to_dict()]
+
+
 def test_human_summary_privacy() -> None:
     """human_summary should not leak raw match strings."""
     finding = _sample_finding()
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from vaulty.scanner import read_any, scan_file
+from vaulty.scanner import read_any, scan_bytes, scan_file
 
 
 def test_read_any_txt(tmp_path: Path) -> None:
@@ -38,3 +38,27 @@ def test_scan_file_no_findings(tmp_path: Path) -> None:
 
     assert len(findings) == 0
     assert text == "Just some clean text."
+
+
+def test_scan_bytes_matches_scan_file(tmp_path: Path) -> None:
+    data = b"Email: a@b.com SSN: 123-45-6789"
+    test_file = tmp_path / "doc.txt"
+    test_file.write_bytes(data)
+
+    assert scan_bytes(data, ".TXT") == scan_file(test_file)
+    assert scan_bytes(memoryview(data), ".txt") == scan_file(test_file)
+
+
+def test_scan_bytes_unsupported_suffix() -> None:
+    assert scan_bytes(b"PK\x03\x04", ".docx") == ([], "")
+
+
+def test_scan_bytes_pdf(tmp_path: Path, minimal_pdf: bytes) -> None:
+    findings, text = scan_bytes(memoryview(minimal_pdf), ".pdf")
+
+    assert [f.detector for f in findings] == ["email"]
+    assert "a@b.com" in text
+
+    test_file = tmp_path / "doc.pdf"
+    test_file.write_bytes(minimal_pdf)
+    assert scan_file(test_file) == (findings, text)
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from vaulty.validators import digits_only, luhn_valid
+
+
+def _reference_luhn(candidate: str) -> bool:
+    digits = [int(ch) for ch in candidate if "0" <= ch <= "9"]
+    if not 13 <= len(digits) <= 19:
+        return False
+    total = 0
+    for index, digit in enumerate(reversed(digits)):
+        if index % 2 == 1:
+            digit = digit * 2 - 9 if digit > 4 else digit * 2
+        total += digit
+    return total % 10 == 0
+
+
+def test_digits_only() -> None:
+    assert digits_only("4111-1111 1111.1111") == "4111111111111111"
+    assert digits_only("\u0664\u0661 42\u00b2") == "4142"
+    assert digits_only("\uff14\uff11-\uff11") == "411"
+
+
+@pytest.mark.parametrize(
+    "candidate",
+    ["4111 1111 1111 1111", "4111-1111-1111-1111", "378282246310005", "6011111111111117"],
+)
+def test_luhn_valid_accepts_known_cards(candidate: str) -> None:
+    assert luhn_valid(candidate)
+
+
+@pytest.mark.parametrize("zero", ["\uff10", "\u0660", "\u0966"])
+def test_luhn_valid_accepts_unicode_decimal_digits(zero: str) -> None:
+    digits = "".join(chr(ord(zero) + value) for value in range(10))
+    assert luhn_valid("4111 1111 1111 1111".translate(str.maketrans("0123456789", digits)))
+
+
+@pytest.mark.parametrize(
+    "candidate",
+    ["4111 1111 1111 1112", "411111111111", "41111111111111111111", "no digits here"],
+)
+def test_luhn_valid_rejects_bad_checksum_or_length(candidate: str) -> None:
+    assert not luhn_valid(candidate)
+
+
+def test_luhn_valid_matches_reference() -> None:
+    rng = random.Random(0)
+    for _ in range(5000):
+        candidate = "".join(rng.choice("0123456789 -") for _ in range(rng.randint(12, 24)))
+        assert luhn_valid(candidate) == _reference_luhn(candidate), candidate
+